@@ -5,13 +5,18 @@ from libcpp.map cimport map
 
 from mettagrid.grid_object cimport TypeId, GridObjectId
 from mettagrid.action cimport ActionHandler, ActionArg
-from mettagrid.objects cimport Agent
+from mettagrid.objects cimport Agent, InventoryItem
 
 cdef struct StatNames:
     string action
     string action_energy
     map[TypeId, string] target
     map[TypeId, string] target_energy
+    map[TypeId, string] damage
+    map[TypeId, string] destroyed
+    map[InventoryItem, string] used
+    map[InventoryItem, string] gained
+    map[InventoryItem, string] stolen
 
 cdef class MettaActionHandler(ActionHandler):
     cdef StatNames _stats
@@ -5,7 +5,7 @@ from omegaconf import OmegaConf
 
 from mettagrid.grid_object cimport GridObjectId
 from mettagrid.action cimport ActionHandler, ActionArg
-from mettagrid.objects cimport Agent, ObjectTypeNames
+from mettagrid.objects cimport Agent, ObjectTypeNames, InventoryItemNames
 
 cdef extern from "<string>" namespace "std":
     string to_string(int val)
@@ -20,6 +20,13 @@ cdef class MettaActionHandler(ActionHandler):
         for t, n in enumerate(ObjectTypeNames):
             self._stats.target[t] = self._stats.action + "." + n
             self._stats.target_energy[t] = self._stats.action_energy + "." + n
+            self._stats.damage[t] = "damage." + n
+            self._stats.destroyed[t] = "destroyed." + n
+
+        for i, n in enumerate(InventoryItemNames):
+            self._stats.used[<InventoryItem>i] = n + ".used"
+            self._stats.gained[<InventoryItem>i] = n + ".gained"
+            self._stats.stolen[<InventoryItem>i] = n + ".stolen"
 
         self.action_cost = cfg.cost
 
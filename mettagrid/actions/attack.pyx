@@ -51,8 +51,8 @@ cdef class Attack(MettaActionHandler):
                 self.env._stats.agent_incr(actor_id, "attack.frozen")
                 for item in range(InventoryItem.InventoryCount):
                     actor.update_inventory(item, agent_target.inventory[item])
-                    self.env._stats.agent_add(actor_id, InventoryItemNames[item] + ".stolen", agent_target.inventory[item])
-                    self.env._stats.agent_add(actor_id, InventoryItemNames[item] + ".gained", agent_target.inventory[item])
+                    self.env._stats.agent_add(actor_id, self._stats.stolen[<InventoryItem>item].c_str(), agent_target.inventory[item])
+                    self.env._stats.agent_add(actor_id, self._stats.gained[<InventoryItem>item].c_str(), agent_target.inventory[item])
                     agent_target.inventory[item] = 0
 
             return True
@@ -62,10 +62,10 @@ cdef class Attack(MettaActionHandler):
         if object_target:
             self.env._stats.agent_incr(actor_id, self._stats.target[object_target._type_id].c_str())
             object_target.hp -= 1
-            self.env._stats.agent_incr(actor_id, "damage." + ObjectTypeNames[object_target._type_id])
+            self.env._stats.agent_incr(actor_id, self._stats.damage[object_target._type_id].c_str())
             if object_target.hp <= 0:
                 self.env._grid.remove_object(object_target)
-                self.env._stats.agent_incr(actor_id, "destroyed." + ObjectTypeNames[object_target._type_id])
+                self.env._stats.agent_incr(actor_id, self._stats.destroyed[object_target._type_id].c_str())
 
             return True
 
@@ -59,10 +59,10 @@ cdef class Use(MettaActionHandler):
         if target._type_id == ObjectType.ConverterT:
             converter = <Converter*>target
             actor.update_inventory(converter.input_resource, -1)
-            self.env._stats.agent_incr(actor_id, InventoryItemNames[converter.input_resource] + ".used")
+            self.env._stats.agent_incr(actor_id, self._stats.used[converter.input_resource].c_str())
 
             actor.update_inventory(converter.output_resource, 1)
-            self.env._stats.agent_incr(actor_id, InventoryItemNames[converter.output_resource] + ".gained")
+            self.env._stats.agent_incr(actor_id, self._stats.gained[converter.output_resource].c_str())
 
             energy_gain = actor.update_energy(converter.output_energy, &self.env._rewards[actor_id])
 
@@ -75,23 +75,26 @@ class MettaGridGameBuilder():
         return final_level
 
     def build_room(self, room_config, starting_agent=1):
-        symbols = []
         content_width = room_config.width - 2*room_config.border
         content_height = room_config.height - 2*room_config.border
         area = content_width * content_height
 
-        # Add all objects in the proper amounts to a single large array.
+        num_objects = sum(room_config.objects.values())
+        assert(num_objects <= area), f"Too many objects in room: {num_objects} > {area}"
+
+        # Fill a preallocated array with all objects in the proper amounts,
+        # leaving the rest of the room empty.
+        symbols = np.full(area, ".", dtype="U8")
+        offset = 0
         for obj_name, count in room_config.objects.items():
             symbol = self._symbols[obj_name]
             if obj_name == "agent":
-                symbols.extend([f"{symbol}{i+starting_agent}" for i in range(count)])
+                symbols[offset:offset + count] = [f"{symbol}{i+starting_agent}" for i in range(count)]
             else:
-                symbols.extend([symbol] * count)
-        assert(len(symbols) <= area), f"Too many objects in room: {len(symbols)} > {area}"
-        symbols.extend(["."] * (area - len(symbols)))
+                symbols[offset:offset + count] = symbol
+            offset += count
 
         # Shuffle and reshape the array into a room.
-        symbols = np.array(symbols).astype("U8")
         np.random.shuffle(symbols)
         content = symbols.reshape(content_height, content_width)
 
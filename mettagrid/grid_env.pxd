@@ -23,11 +23,14 @@ cdef class GridEnv:
         unsigned int _max_timestep
 
         list[ActionHandler] _action_handlers
+        unsigned int _num_action_handlers
         vector[unsigned char] _max_action_args
         unsigned char _max_action_arg
 
         bint _use_flat_actions
         vector[Action] _flat_actions
+        dict _flat_action_ids
+        cnp.ndarray _flat_action_table
 
         ObservationEncoder _obs_encoder
 
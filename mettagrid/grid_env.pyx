@@ -42,8 +42,10 @@ cdef class GridEnv:
 
         self._use_flat_actions = use_flat_actions
         self._action_handlers = action_handlers
+        self._num_action_handlers = len(action_handlers)
         self._max_action_arg = 0
         self._max_action_args.resize(len(action_handlers))
+        self._flat_action_ids = {}
         for i, handler in enumerate(action_handlers):
             (<ActionHandler>handler).init(self)
             max_arg = (<ActionHandler>handler).max_arg()
@@ -51,7 +53,11 @@ cdef class GridEnv:
             self._max_action_arg = max(self._max_action_arg, max_arg)
             if use_flat_actions:
                 for arg in range(max_arg+1):
+                    self._flat_action_ids[(i, arg)] = self._flat_actions.size()
                     self._flat_actions.push_back(Action(i, arg))
+        # Flat index -> (action, arg), for unflattening a batch in one gather.
+        self._flat_action_table = np.array(
+            list(self._flat_action_ids), dtype=np.int32).reshape(-1, 2)
 
         self._event_manager = EventManager(self, event_handlers)
         self._stats = StatsTracker(max_agents)
@@ -90,22 +96,22 @@ cdef class GridEnv:
             cdef unsigned int obs_r, obs_c
             cdef ObsType[:] agent_ob
 
+        # Clamp the observation window to the grid once, instead of
+        # bounds-checking every cell.
         cdef unsigned int r_start = max(observer_r, obs_height_r) - obs_height_r
         cdef unsigned int c_start = max(observer_c, obs_width_r) - obs_width_r
-        for r in range(r_start, observer_r + obs_height_r + 1):
-            if r < 0 or r >= self._grid.height:
-                continue
-            for c in range(c_start, observer_c + obs_width_r + 1):
-                if c < 0 or c >= self._grid.width:
-                    continue
+        cdef unsigned int r_end = min(observer_r + obs_height_r + 1, self._grid.height)
+        cdef unsigned int c_end = min(observer_c + obs_width_r + 1, self._grid.width)
+        for r in range(r_start, r_end):
+            obs_r = r + obs_height_r - observer_r
+            for c in range(c_start, c_end):
+                obs_c = c + obs_width_r - observer_c
                 for layer in range(self._grid.num_layers):
                     object_loc = GridLocation(r, c, layer)
                     obj = self._grid.object_at(object_loc)
                     if obj == NULL:
                         continue
 
-                    obs_r = object_loc.r + obs_height_r - observer_r
-                    obs_c = object_loc.c + obs_width_r - observer_c
                     agent_ob = observation[:, obs_r, obs_c]
                     self._obs_encoder.encode(obj, agent_ob)
 
@@ -120,9 +126,7 @@ cdef class GridEnv:
                 self._obs_height,
                 self._observations[idx]
             )
-
-        if self._track_last_action:
-            for idx in range(self._agents.size()):
+            if self._track_last_action:
                 self._observations[idx][24][self._middle_y][self._middle_x] = actions[idx][0]
                 self._observations[idx][25][self._middle_y][self._middle_x] = actions[idx][1]
 
@@ -142,7 +146,7 @@ cdef class GridEnv:
 
         for idx in range(self._agents.size()):
             action = actions[idx][0]
-            if action >= len(self._action_handlers):
+            if action < 0 or <unsigned int>action >= self._num_action_handlers:
                 continue
             arg = actions[idx][1]
             agent = self._agents[idx]
@@ -160,11 +164,7 @@ cdef class GridEnv:
 
     cdef cnp.ndarray _unflatten_actions(self, cnp.ndarray actions):
         if self._use_flat_actions:
-            new_actions = np.zeros((len(actions), 2), dtype=np.int32)
-            for idx, action in enumerate(actions):
-                new_actions[idx][0] = self._flat_actions[action].action
-                new_actions[idx][1] = self._flat_actions[action].arg
-            return new_actions
+            return self._flat_action_table[actions]
         return actions
 
     ###############################
@@ -266,19 +266,20 @@ cdef class GridEnv:
         return (self._observations_np, self._terminals_np, self._truncations_np, self._rewards_np)
 
     cpdef cnp.ndarray render_ascii(self, list[char] type_to_char):
-        cdef GridObject *obj
-        grid = np.full((self._grid.height, self._grid.width), " ", dtype=np.str_)
-        for obj_id in range(1, self._grid.objects.size()):
-            obj = self._grid.object(obj_id)
-            grid[obj.location.r, obj.location.c] = type_to_char[obj._type_id]
-        return grid
+        # grid_objects_types() uses 0 for empty cells and type_id + 1 otherwise.
+        chars = np.array([" "] + list(type_to_char), dtype=np.str_)
+        return chars[self.grid_objects_types()]
 
     cpdef cnp.ndarray grid_objects_types(self):
         cdef GridObject *obj
+        cdef unsigned int obj_id
         grid = np.zeros((self._grid.height, self._grid.width), dtype=np.uint8)
+        cdef unsigned char[:, :] grid_view = grid
         for obj_id in range(1, self._grid.objects.size()):
             obj = self._grid.object(obj_id)
-            grid[obj.location.r, obj.location.c] = obj._type_id + 1
+            if obj == NULL:
+                continue
+            grid_view[obj.location.r, obj.location.c] = obj._type_id + 1
         return grid
 
     cpdef cnp.ndarray unflatten_actions(self, cnp.ndarray actions):
@@ -293,7 +294,6 @@ cdef class GridEnv:
 
     @property
     def observation_space(self):
-        space = self._obs_encoder.observation_space()
         return gym.spaces.Box(
             0,
             255,
@@ -305,8 +305,7 @@ cdef class GridEnv:
         if not self._use_flat_actions:
             return actions
 
-        new_actions = []
-        flat_actions_dict = { (action["action"], action["arg"]): idx for idx, action in enumerate(self._flat_actions) }
-        for action in actions:
-            new_actions.append(flat_actions_dict[(action[0], action[1])])
-        return np.array(new_actions, dtype=np.uint32)
+        new_actions = np.empty(len(actions), dtype=np.uint32)
+        for idx, action in enumerate(actions):
+            new_actions[idx] = self._flat_action_ids[(action[0], action[1])]
+        return new_actions
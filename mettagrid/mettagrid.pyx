@@ -26,13 +26,20 @@ from mettagrid.actions.swap import Swap
 cdef class MettaGrid(GridEnv):
     cdef:
         object _cfg
+        bint _kinship_enabled
+        bint _kinship_observed
+        double _team_reward
         int _num_teams
         list _agents_to_team
         list _team_to_agents
+        cnp.ndarray _team_rewards
 
     def __init__(self, env_cfg: OmegaConf, map: np.ndarray):
         cfg = OmegaConf.create(env_cfg.game)
         self._cfg = cfg
+        self._kinship_enabled = cfg.kinship.enabled
+        self._kinship_observed = cfg.kinship.observed
+        self._team_reward = cfg.kinship.team_reward
 
         obs_encoder = MettaObservationEncoder()
         if env_cfg.compact_obs:
@@ -74,26 +81,27 @@ cdef class MettaGrid(GridEnv):
         cdef Agent *agent
         for r in range(map.shape[0]):
             for c in range(map.shape[1]):
-                if map[r,c] == "W":
+                cell = map[r,c]
+                if cell == "W":
                     self._grid.add_object(new Wall(r, c, cfg.objects.wall))
                     self._stats.game_incr("objects.wall")
-                elif map[r,c] == "g":
+                elif cell == "g":
                     self._grid.add_object(new Generator(r, c, cfg.objects.generator))
                     self._stats.game_incr("objects.generator")
-                elif map[r,c] == "c":
+                elif cell == "c":
                     self._grid.add_object(new Converter(r, c, cfg.objects.converter))
                     self._stats.game_incr("objects.converter")
-                elif map[r,c] == "a":
+                elif cell == "a":
                     self._grid.add_object(new Altar(r, c, cfg.objects.altar))
                     self._stats.game_incr("objects.altar")
-                elif map[r,c][0] == "A":
+                elif cell.startswith("A"):
                     agent = new Agent(r, c, cfg.objects.agent)
                     self._grid.add_object(agent)
                     self.add_agent(agent)
                     self._stats.game_incr("objects.agent")
 
         # Assign team to agents for kinship rewards sharing.
-        if cfg.kinship.enabled:
+        if self._kinship_enabled:
             self._initialize_reward_sharing()
 
     cdef void _initialize_reward_sharing(self):
@@ -116,23 +124,27 @@ cdef class MettaGrid(GridEnv):
         for id in range(self._agents.size()):
             team = self._agents_to_team[id]
             self._team_to_agents[team].append(id)
+        self._team_to_agents = [np.array(agents, dtype=np.intp) for agents in self._team_to_agents]
+        self._team_rewards = np.zeros(self._num_teams + 1)
 
     cpdef list[str] grid_features(self):
         cdef list[str] features = super(MettaGrid, self).grid_features()
-        if self._cfg.kinship.enabled:
+        if self._kinship_enabled:
             features.append("agent:kinship")
         return features
 
     def render(self):
         grid = self.render_ascii(["A", "#", "g", "c", "a"])
-        for r in grid:
-            print("".join(r))
+        print("\n".join("".join(r) for r in grid))
 
     cpdef grid_objects(self):
         cdef GridObject *obj
-        cdef ObsType[:] obj_data = np.zeros(len(self.grid_features()), dtype=self._obs_encoder.obs_np_type())
-        cdef unsigned int obj_id, i
+        obj_data_np = np.zeros(len(self.grid_features()), dtype=self._obs_encoder.obs_np_type())
+        cdef ObsType[:] obj_data = obj_data_np
+        cdef unsigned int obj_id
         cdef MettaObservationEncoder obs_encoder = <MettaObservationEncoder>self._obs_encoder
+        # Convert the feature names to Python once, not once per object.
+        type_feature_names = obs_encoder._type_feature_names
         objects = {}
         for obj_id in range(1, self._grid.objects.size()):
             obj = self._grid.object(obj_id)
@@ -146,39 +158,48 @@ cdef class MettaGrid(GridEnv):
                 "layer": obj.location.layer
             }
             obs_encoder._encode(obj, obj_data, 0)
-            for i, name in enumerate(obs_encoder._type_feature_names[obj._type_id]):
-                objects[obj_id][name] = obj_data[i]
+            objects[obj_id].update(zip(
+                type_feature_names[obj._type_id],
+                obj_data_np.tolist()))
 
         for agent_idx in range(self._agents.size()):
             agent_object = objects[self._agents[agent_idx].id]
             agent_object["agent_id"] = agent_idx
-            if self._cfg.kinship.enabled:
+            if self._kinship_enabled:
                 agent_object["team"] = self._agents_to_team[agent_idx]
 
         return objects
 
     cdef void _add_kinship_observations(self, cnp.ndarray obs):
         """ Insert kinship into observation. """
-        offset_r = obs.shape[2] // 2
-        offset_c = obs.shape[3] // 2
-        for observer_idx in range(self._agents.size()):
-            observer_agent = self._agents[observer_idx]
-            for agent_idx in range(self._agents.size()):
-                agent = self._agents[agent_idx]
-                team = self._agents_to_team[agent_idx]
-                relative_r = agent.location.r - observer_agent.location.r + offset_r
-                relative_c = agent.location.c - observer_agent.location.c + offset_c
-                if (relative_r >= 0 and relative_r < obs.shape[2] and
-                    relative_c >= 0 and relative_c < obs.shape[3]):
-                    obs[observer_idx][24][relative_r][relative_c] = team
+        cdef unsigned int idx, num_agents = self._agents.size()
+        locations = np.empty((num_agents, 2), dtype=np.int64)
+        cdef long long[:, :] locations_view = locations
+        for idx in range(num_agents):
+            locations_view[idx, 0] = self._agents[idx].location.r
+            locations_view[idx, 1] = self._agents[idx].location.c
+
+        # Location of every agent relative to every observer, shifted so the
+        # observer is at the center of its observation window. Locations are
+        # widened from GridCoord first so offsets up or left of the observer
+        # come out negative instead of wrapping.
+        relative = locations[None, :, :] - locations[:, None, :]
+        relative_r = relative[:, :, 0] + obs.shape[2] // 2
+        relative_c = relative[:, :, 1] + obs.shape[3] // 2
+        visible = ((relative_r >= 0) & (relative_r < obs.shape[2]) &
+                   (relative_c >= 0) & (relative_c < obs.shape[3]))
+        observer_idxs, agent_idxs = visible.nonzero()
+        obs[observer_idxs, 24, relative_r[visible], relative_c[visible]] = \
+            np.asarray(self._agents_to_team)[agent_idxs]
 
     def _compute_shared_rewards(self, cnp.ndarray rewards):
         """ Compute shared rewards for agents in the same team. """
-        team_rewards = np.zeros(self._num_teams + 1)
+        team_rewards = self._team_rewards
+        team_rewards.fill(0)
         for agent_idx in range(self._agents.size()):
             team = self._agents_to_team[agent_idx]
-            team_rewards[team] += self._cfg.kinship.team_reward * rewards[agent_idx]
-            rewards[agent_idx] -= self._cfg.kinship.team_reward * rewards[agent_idx]
+            team_rewards[team] += self._team_reward * rewards[agent_idx]
+            rewards[agent_idx] -= self._team_reward * rewards[agent_idx]
         team_idxs = team_rewards.nonzero()[0]
         for team in team_idxs:
             team_agents = self._team_to_agents[team]
@@ -188,10 +209,10 @@ cdef class MettaGrid(GridEnv):
     cpdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray, cnp.ndarray, dict] step(self, cnp.ndarray actions):
         (obs, rewards, terms, truncs, infos) = super(MettaGrid, self).step(actions)
 
-        if self._cfg.kinship.enabled:
-            if self._cfg.kinship.observed:
+        if self._kinship_enabled:
+            if self._kinship_observed:
                 self._add_kinship_observations(obs)
-            if self._cfg.kinship.team_reward > 0 and np.any(rewards > 0):
+            if self._team_reward > 0 and np.any(rewards > 0):
                 self._compute_shared_rewards(rewards)
 
         return (obs, rewards, terms, truncs, infos)
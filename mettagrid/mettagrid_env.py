@@ -13,7 +13,11 @@ class MettaGridEnv(pufferlib.PufferEnv, gym.Env):
     def __init__(self, render_mode: str, buf=None, **cfg):
 
         self._render_mode = render_mode
+        # The config is frozen after construction: without sampling, make_env
+        # resolves it only once, so later edits would silently be ignored.
         self._cfg = OmegaConf.create(cfg)
+        OmegaConf.set_readonly(self._cfg, True)
+        self._env_cfg = None
         self.make_env()
         self.should_reset = False
         self._renderer = None
@@ -21,10 +25,13 @@ class MettaGridEnv(pufferlib.PufferEnv, gym.Env):
         super().__init__(buf)
 
     def make_env(self):
-        scfg = sample_config(self._cfg, self._cfg.sampling)
-        assert isinstance(scfg, Dict)
-        self._env_cfg = OmegaConf.create(scfg)
-        self._game_builder = MettaGridGameBuilder(**self._env_cfg.game) # type: ignore
+        # Without sampling the (frozen) config is the same every episode, so it
+        # is only resolved once; the level is still rebuilt on every reset.
+        if self._env_cfg is None or self._cfg.sampling != 0:
+            scfg = sample_config(self._cfg, self._cfg.sampling)
+            assert isinstance(scfg, Dict)
+            self._env_cfg = OmegaConf.create(scfg)
+            self._game_builder = MettaGridGameBuilder(**self._env_cfg.game) # type: ignore
         level = self._game_builder.level()
         self._c_env = MettaGrid(self._env_cfg, level)
         self._grid_env = self._c_env
@@ -53,7 +60,7 @@ class MettaGridEnv(pufferlib.PufferEnv, gym.Env):
         return obs, infos
 
     def step(self, actions):
-        self.actions[:] = np.array(actions).astype(np.int32)
+        self.actions[:] = actions
         self._c_env.step(self.actions)
 
         if self._cfg.normalize_rewards:
@@ -84,11 +91,12 @@ class MettaGridEnv(pufferlib.PufferEnv, gym.Env):
         infos["game"] = stats["game"]
         infos["agent"] = {}
 
-        for agent_stats in stats["agent"]:
-            for n, v in agent_stats.items():
-                infos["agent"][n] = infos["agent"].get(n, 0) + v
-        for n, v in infos["agent"].items():
-            infos["agent"][n] = v / self._num_agents
+        # Every agent reports the same stat names (missing ones are 0), so
+        # the per-agent stats can be averaged as a single array.
+        if stats["agent"]:
+            stat_names = list(stats["agent"][0])
+            values = np.array([[a[n] for n in stat_names] for a in stats["agent"]])
+            infos["agent"] = dict(zip(stat_names, (values.sum(axis=0) / self._num_agents).tolist()))
 
     def _compute_max_energy(self):
         pass
@@ -48,6 +48,7 @@ cdef enum ObjectType:
     Count = 5
 
 cdef vector[string] ObjectTypeNames # defined in objects.pyx
+cdef vector[string] ResetStatNames # defined in objects.pyx
 
 cdef enum InventoryItem:
     r1 = 0,
@@ -210,7 +211,7 @@ cdef class ResetHandler(EventHandler):
             return
 
         usable.ready = True
-        self.env._stats.game_incr("resets." + ObjectTypeNames[usable._type_id])
+        self.env._stats.game_incr(ResetStatNames[usable._type_id].c_str())
 
 cdef enum Events:
     Reset = 0
@@ -13,6 +13,11 @@ cdef vector[string] ObjectTypeNames = <vector[string]>[
     "altar"
 ]
 
+cdef vector[string] ResetStatNames
+cdef string _type_name
+for _type_name in ObjectTypeNames:
+    ResetStatNames.push_back("resets." + _type_name)
+
 cdef vector[string] InventoryItemNames = <vector[string]>[
     "r1",
     "r2",
@@ -31,6 +31,7 @@ class MettaGridRaylibRenderer:
         self.window_width = 1280
         self.window_height = 720
         self.num_agents = env.num_agents()
+        self.grid_features = env.grid_features()
 
         self.sidebar_width = 250
         self.tile_size = 24
@@ -66,6 +67,7 @@ class MettaGridRaylibRenderer:
         self.ffi = FFI()
 
         self.game_objects = {}
+        self.object_at = {}
         self.actions = torch.zeros((self.num_agents, 2), dtype=torch.int64)
         self.observations = {}
         self.current_timestep = 0
@@ -86,8 +88,10 @@ class MettaGridRaylibRenderer:
         self.observations = observations
         self.current_timestep = current_timestep
         self.game_objects = self.env.grid_objects()
+        self.object_at = {}
         for obj_id, obj in self.game_objects.items():
             obj["id"] = obj_id
+            self.object_at.setdefault((obj["r"], obj["c"]), obj_id)
             if "agent_id" in obj:
                 agent_id = obj["agent_id"]
                 self.agents[agent_id] = obj
@@ -162,11 +166,7 @@ class MettaGridRaylibRenderer:
         grid_x = int(pos.x // self.tile_size)
         grid_y = int(pos.y // self.tile_size)
 
-        self.hover_object_id = None
-        for obj_id, obj in self.game_objects.items():
-            if obj["c"] == grid_x and obj["r"] == grid_y:
-                self.hover_object_id = obj_id
-                break
+        self.hover_object_id = self.object_at.get((grid_y, grid_x))
 
         if ray.is_mouse_button_pressed(ray.MOUSE_LEFT_BUTTON):
             self.selected_object_id = self.hover_object_id
@@ -245,8 +245,8 @@ class MettaGridRaylibRenderer:
         feature_name = "disabled"
 
         # Clamp the observation index to be between -1 and the number of features minus 1
-        self.obs_idx = max(-1, min(self.obs_idx, len(self.env.grid_features()) - 1))
-        feature_name = self.env.grid_features()[self.obs_idx]
+        self.obs_idx = max(-1, min(self.obs_idx, len(self.grid_features) - 1))
+        feature_name = self.grid_features[self.obs_idx]
 
         obs_txt = f"Press ? for help. Obs: {feature_name} (-/=)"
         rl.DrawTextEx(self.font, obs_txt.encode(),
@@ -30,20 +30,21 @@ cdef class StatsTracker:
         for agent_stats in self._agent_stats:
             new_stats = {}
             for k, v in agent_stats:
-                agent_stat_names.add(k)
                 new_stats[k] = v
+            agent_stat_names.update(new_stats)
             new_agent_stats.append(new_stats)
 
         # We have to convert stat names to unicode strings
         # for better python interface. We also want to make
         # sure to return 0s for any missing stats otherwise
         # pufferlib won't average correctly.
+        for new_stats in new_agent_stats:
+            for k in agent_stat_names.difference(new_stats):
+                new_stats[k] = 0
+
         return {
             "game": {
                 k: v for k, v in self._game_stats
             },
-            "agent": [{
-                    k: a.get(k, 0) for k in agent_stat_names
-                } for a in new_agent_stats
-            ]
+            "agent": new_agent_stats
         }
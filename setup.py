@@ -1,4 +1,3 @@
-from sympy import li
 from setuptools import Extension, setup, find_packages, Command
 from Cython.Build import cythonize
 import numpy
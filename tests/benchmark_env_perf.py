@@ -1,3 +1,4 @@
+import itertools
 import time
 
 import hydra
@@ -11,15 +12,19 @@ global env
 
 def test_performance(env, actions, duration):
     tick = 0
-    num_actions = actions.shape[0]
+    # Cycle through the action batches and only check the clock every
+    # 100 steps, so the loop times env.step rather than its own overhead.
+    batches = itertools.cycle(actions)
     start = time.time()
+    elapsed = 0
     with tqdm(total=duration, desc="Running performance test") as pbar:
-        while time.time() - start < duration:
-            atns = actions[tick % num_actions]
-            obs, rewards, terminated, truncated, infos = env.step(atns)
-            tick += 1
-            if tick % 100 == 0:
-                pbar.update(time.time() - start - pbar.n)
+        while elapsed < duration:
+            for _ in range(100):
+                atns = next(batches)
+                obs, rewards, terminated, truncated, infos = env.step(atns)
+            tick += 100
+            elapsed = time.time() - start
+            pbar.update(elapsed - pbar.n)
 
     print_stats(env._c_env.get_episode_stats())
     sps = atns.shape[0] * tick / (time.time() - start)
@@ -41,7 +46,7 @@ def main(cfg):
     env.reset()
     global actions
     num_agents = cfg.env.game.num_agents
-    actions = np.random.randint(0, env.action_space.shape, (1024, num_agents, 2), dtype=np.uint32)
+    actions = np.random.default_rng().integers(0, env.action_space.shape, (1024, num_agents, 2), dtype=np.uint32)
 
     env._c_env.render()
     test_performance(env, actions, 5)
@@ -60,44 +65,21 @@ def print_stats(stats):
     # Extract game_stats
     game_stats = stats["game"]
 
-    # Extract agent_stats
-    agent_stats = stats["agent"]
-
-    # Calculate total, average, min, and max for each agent stat
-    total_agent_stats = {}
-    avg_agent_stats = {}
-    min_agent_stats = {}
-    max_agent_stats = {}
-    num_agents = len(agent_stats)
-
-    for agent_stat in agent_stats:
-        for key, value in agent_stat.items():
-            if key not in total_agent_stats:
-                total_agent_stats[key] = 0
-                min_agent_stats[key] = float('inf')
-                max_agent_stats[key] = float('-inf')
-            total_agent_stats[key] += value
-            if value < min_agent_stats[key]:
-                min_agent_stats[key] = value
-            if value > max_agent_stats[key]:
-                max_agent_stats[key] = value
-
-    for key, value in total_agent_stats.items():
-        avg_agent_stats[key] = value / num_agents
-
-    # Sort the keys alphabetically
-    sorted_keys = sorted(total_agent_stats.keys())
+    # Extract agent_stats, one row per agent with the stats sorted alphabetically
+    agent_stats = pd.DataFrame(stats["agent"])
+    agent_stats = agent_stats[sorted(agent_stats.columns)]
 
     # Create DataFrame for game_stats
     game_stats_df = pd.DataFrame(sorted(game_stats.items()), columns=["Stat", "Value"])
 
-    # Create DataFrame for agent stats
+    # Create DataFrame for agent stats, with total, average, min, and max
+    # computed per stat across agents
     agent_stats_df = pd.DataFrame({
-        "Stat": sorted_keys,
-        "Total": [total_agent_stats[key] for key in sorted_keys],
-        "Average": [avg_agent_stats[key] for key in sorted_keys],
-        "Min": [min_agent_stats[key] for key in sorted_keys],
-        "Max": [max_agent_stats[key] for key in sorted_keys]
+        "Stat": agent_stats.columns,
+        "Total": agent_stats.sum().values,
+        "Average": agent_stats.mean().values,
+        "Min": agent_stats.min().values,
+        "Max": agent_stats.max().values
     })
 
     # Print the DataFrames
@@ -43,37 +43,42 @@ def dump_map(env):
 
 def render_to_string(env, show_team=False):
     """ Render the environment to a string """
+    # Index objects by cell once; the first object at a cell wins.
+    cells = {}
+    for thing in env.grid_objects.values():
+      cells.setdefault((thing["r"], thing["c"]), thing)
+
     output = ""
     for x in range(env.map_width):
       for y in range(env.map_height):
         cell = " "
-        for thing in env.grid_objects.values():
-          if thing["r"] == x and thing["c"] == y:
-            if thing["type"] == 0: # agent
-              if show_team:
-                cell = f"{thing['team']}"
-              else:
-                cell = "A"
-            elif thing["type"] == 1: # wall
-              cell = "#"
-            elif thing["type"] == 2: # generator
-              cell = "g"
-            elif thing["type"] == 3: # converter
-              cell = "c"
-            elif thing["type"] == 4: # altar
-              cell = "a"
-            break
+        thing = cells.get((x, y))
+        if thing is not None:
+          if thing["type"] == 0: # agent
+            if show_team:
+              cell = f"{thing['team']}"
+            else:
+              cell = "A"
+          elif thing["type"] == 1: # wall
+            cell = "#"
+          elif thing["type"] == 2: # generator
+            cell = "g"
+          elif thing["type"] == 3: # converter
+            cell = "c"
+          elif thing["type"] == 4: # altar
+            cell = "a"
         output += cell
       output += "\n"
     return output
 
 def render_obs_to_string(env, obs, match=None):
   output = ""
+  grid_features = env.grid_features
   for agentId in range(env._c_env.num_agents()):
       output += "Agent: " + str(agentId) + "\n"
       for feature_id, feature in enumerate(obs[agentId]):
           try:
-              feature_name = env.grid_features[feature_id]
+              feature_name = grid_features[feature_id]
           except IndexError:
               feature_name = "???"
           if match is None or match in feature_name:
@@ -0,0 +1,41 @@
+import numpy as np
+from mettagrid.mettagrid_c import MettaGrid
+from omegaconf import OmegaConf
+
+map = np.array([
+  ["W", "W", "W"],
+  ["W", "A", "W"],
+  ["W", "W", "W"]
+])
+cfg = OmegaConf.load('configs/test_basic.yaml')
+
+cfg.game.num_agents = 1
+cfg.game.objects.wall.hp = 1
+
+# Destroying an object leaves a NULL slot in the grid's object list; rendering
+# and listing object types must skip it.
+metta_grid = MettaGrid(cfg, map)
+metta_grid.reset()
+num_walls = (metta_grid.grid_objects_types() == 2).sum()
+
+attack = metta_grid.action_names().index("attack")
+actions = np.array([[attack, 2]], dtype=np.int32)
+metta_grid.step(actions)
+assert metta_grid.get_episode_stats()["agent"][0]["destroyed.wall"] == 1
+
+types = metta_grid.grid_objects_types()
+assert (types == 2).sum() == num_walls - 1, types
+assert (types == 1).sum() == 1, types
+ascii = metta_grid.render_ascii(["A", "#", "g", "c", "a"])
+assert (ascii == " ").sum() == 1, ascii
+assert (ascii == "#").sum() == num_walls - 1, ascii
+assert len(metta_grid.grid_objects()) == num_walls
+
+# Negative action ids are out of range and are skipped like any other.
+metta_grid = MettaGrid(cfg, map)
+metta_grid.reset()
+objects = metta_grid.grid_objects()
+for action in [-1, -len(metta_grid.action_names())]:
+  metta_grid.step(np.array([[action, 0]], dtype=np.int32))
+assert metta_grid.grid_objects() == objects
+assert metta_grid.get_episode_stats()["agent"][0] == {}
@@ -1,4 +1,3 @@
-import hydra
 import numpy as np
 from mettagrid.mettagrid_c import MettaGrid
 from omegaconf import OmegaConf
@@ -36,6 +35,22 @@ actions = np.array([
 (obs, rewards, terms, truncs, infos) = metta_grid.step(actions)
 assert str(rewards) == "[0. 0. 0. 0.]"
 
+# Every agent inside the observer's window is marked with its team, in any
+# direction from the observer.
+kinship = metta_grid.grid_features().index("agent:kinship")
+agents = sorted(
+  (o for o in metta_grid.grid_objects().values() if "agent_id" in o),
+  key=lambda o: o["agent_id"])
+center_r = obs.shape[2] // 2
+center_c = obs.shape[3] // 2
+for observer in agents:
+  expected = np.zeros(obs.shape[2:], dtype=obs.dtype)
+  for agent in agents:
+    expected[agent["r"] - observer["r"] + center_r,
+             agent["c"] - observer["c"] + center_c] = agent["team"]
+  assert np.array_equal(obs[observer["agent_id"], kinship], expected), \
+    f"kinship for agent {observer['agent_id']}:\n{obs[observer['agent_id'], kinship]}"
+
 
 def test_shared_rewards(msg, rewards, expected, team_reward):
   cfg.game.kinship.team_reward = team_reward